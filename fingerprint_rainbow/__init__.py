@@ -0,0 +1,19 @@
+"""
+Fingerprint Rainbow Optimizer and Visualizer
+
+core    - paper sizes, fingerprint allocation and band geometry (NumPy only)
+render  - matplotlib drawing of a rainbow
+gui     - tkinter application, loaded only when the GUI is started
+
+Run the GUI with: python3 -m fingerprint_rainbow
+"""
+
+from .core import (FingerprintRainbow, PaperSize, PAPER_SIZES, STANDARD_PAPER_NAMES,
+                   STANDARD_PAPER_WIDTHS, STANDARD_PAPER_HEIGHTS, paper_fits)
+
+
+def main():
+    """Main entry point"""
+    # Imported here so using the core never loads tkinter or pyplot
+    from .gui import main as gui_main
+    gui_main()
@@ -0,0 +1,5 @@
+"""Run the Fingerprint Rainbow GUI with: python3 -m fingerprint_rainbow"""
+
+from . import main
+
+main()
@@ -0,0 +1,229 @@
+"""
+Fingerprint Rainbow core: paper sizes, fingerprint allocation and band geometry
+
+Depends only on NumPy, so it can be imported without tkinter or matplotlib.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Tuple, TYPE_CHECKING
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from .render import RainbowArtists
+
+
+@dataclass
+class PaperSize:
+    """Represents a paper size with name and dimensions in inches"""
+    name: str
+    width: float  # inches
+    height: float  # inches
+
+
+# Standard paper sizes
+PAPER_SIZES = {
+    "40x60 Poster (US)": PaperSize("40x60 Poster (US)", 40, 60),
+    "20x30 Poster (US)": PaperSize("20x30 Poster (US)", 20, 30),
+    "Letter (US)": PaperSize("Letter (US)", 8.5, 11),
+    "Legal (US)": PaperSize("Legal (US)", 8.5, 14),
+    "Tabloid (US)": PaperSize("Tabloid (US)", 11, 17),
+    "A4": PaperSize("A4", 8.27, 11.69),
+    "A3": PaperSize("A3", 11.69, 16.54),
+    "A2": PaperSize("A2", 16.54, 23.39),
+    "A1": PaperSize("A1", 23.39, 33.11),
+    "Custom": PaperSize("Custom", 8.5, 11)
+}
+
+# Standard (non-custom) paper sizes as parallel arrays, smallest area first
+STANDARD_PAPER_NAMES = tuple(sorted(
+    (name for name in PAPER_SIZES if name != "Custom"),
+    key=lambda name: (PAPER_SIZES[name].width * PAPER_SIZES[name].height, name)
+))
+STANDARD_PAPER_WIDTHS = np.array([PAPER_SIZES[name].width for name in STANDARD_PAPER_NAMES], dtype=float)
+STANDARD_PAPER_HEIGHTS = np.array([PAPER_SIZES[name].height for name in STANDARD_PAPER_NAMES], dtype=float)
+
+
+def paper_fits(required_width: float, required_height: float, 
+               orientation: str = "portrait") -> np.ndarray:
+    """
+    Check which standard paper sizes can hold the required area
+    
+    Args:
+        required_width: Required width in inches
+        required_height: Required height in inches
+        orientation: "portrait" or "landscape"
+        
+    Returns:
+        Boolean array aligned with STANDARD_PAPER_NAMES
+    """
+    if orientation == "portrait":
+        return (STANDARD_PAPER_WIDTHS >= required_width) & (STANDARD_PAPER_HEIGHTS >= required_height)
+    else:  # landscape
+        return (STANDARD_PAPER_HEIGHTS >= required_width) & (STANDARD_PAPER_WIDTHS >= required_height)
+
+
+# Position of each band counted from the center, in storage order (red=6, ..., violet=0)
+_BAND_FROM_CENTER = np.arange(6, -1, -1)
+
+
+def _band_mid_radii(band_spacing: float) -> np.ndarray:
+    """
+    Radius to the center of each band, red (outermost) to violet (innermost)
+    
+    The innermost band (violet) is centered at band_spacing/2 and each
+    successive band is band_spacing further out.
+    """
+    return band_spacing * (0.5 + _BAND_FROM_CENTER)
+
+
+def _alloc_kernel(band_spacing: float, fingerprint_height: float,
+                  min_inner_prints: int, total: int) -> np.ndarray:
+    """
+    Optimize fingerprint allocation across bands.
+    Each band is a half-circle, so larger radius = more fingerprints can fit.
+    Red (outermost) should have the most, violet (innermost) should have the least.
+    Fingerprints are placed tangent to their neighbors.
+    Respects minimum fingerprint count for innermost band.
+    
+    Pure numeric kernel: takes only scalars and returns an array, so it can be
+    called directly for batch work without going through FingerprintRainbow.
+    
+    Returns:
+        Integer array of fingerprint counts per band, red (outermost) to violet (innermost)
+    """
+    # Calculate how many fingerprints fit in each band based on arc length
+    # Band 0 (red) is outermost with largest radius
+    # Band 6 (violet) is innermost with smallest radius
+    mid_radius = _band_mid_radii(band_spacing)
+    
+    # Number of fingerprints that fit tangent to each other along the arc
+    # Each fingerprint takes up fingerprint_height of arc length
+    capacities = np.pi * mid_radius / fingerprint_height
+    
+    # Normalize to the total number of fingerprints
+    allocations = np.round(capacities / capacities.sum() * total).astype(int)
+    
+    # Ensure innermost band (violet, index 6) meets minimum requirement
+    if allocations[6] < min_inner_prints:
+        allocations[6] = min_inner_prints
+        
+        # Remove from other bands proportionally (prioritize outer bands)
+        remaining_total = total - min_inner_prints
+        outer_capacities = capacities[:6]
+        remaining_capacity = outer_capacities.sum()
+        
+        if remaining_capacity > 0:
+            # Largest remainder method: floor the proportional shares, then hand the
+            # leftover fingerprints to the largest fractional parts so the outer
+            # bands sum to exactly remaining_total (ties go to the outer band)
+            shares = outer_capacities / remaining_capacity * remaining_total
+            outer_allocations = np.floor(shares).astype(int)
+            leftover = remaining_total - outer_allocations.sum()
+            outer_allocations[np.argsort(outer_allocations - shares, kind='stable')[:leftover]] += 1
+            allocations[:6] = outer_allocations
+    
+    # Final adjustment to ensure the exact total
+    diff = total - allocations.sum()
+    if diff != 0:
+        # Add/subtract from the band with most capacity (but not innermost if we just set it)
+        num_candidates = 6 if allocations[6] == min_inner_prints else 7
+        allocations[np.argmax(allocations[:num_candidates])] += diff
+    
+    return allocations
+
+
+@lru_cache(maxsize=256)
+def _compute_layout(fingerprint_width: float, fingerprint_height: float, band_spacing_percent: float,
+                    min_inner_prints: int, total: int
+                    ) -> Tuple[float, Tuple[float, ...], float, float, Tuple[int, ...]]:
+    """
+    Memoized rainbow layout: band geometry, overall dimensions and fingerprint allocation
+    
+    Returns:
+        (band_spacing, mid_radii, width, height, allocations) with lengths in inches
+        and per-band values ordered red (outermost) to violet (innermost)
+    """
+    band_spacing = (band_spacing_percent / 100.0) * fingerprint_height
+    mid_radii = _band_mid_radii(band_spacing)
+    
+    # Total radius includes all 7 bands plus the outer half of the outermost band
+    # Outermost band (red) is centered at the largest mid radius
+    # Plus we need to add fingerprint_width/2 for the outer edge
+    total_radius = float(mid_radii[0]) + fingerprint_width / 2
+    width = 2 * total_radius
+    height = total_radius  # Half circle
+    
+    allocations = _alloc_kernel(band_spacing, fingerprint_height, min_inner_prints, total)
+    return band_spacing, tuple(mid_radii.tolist()), width, height, tuple(allocations.tolist())
+
+
+class FingerprintRainbow:
+    """Core logic for fingerprint rainbow calculation"""
+    
+    # Colors from outermost (largest) to innermost (smallest)
+    COLORS = ['red', 'orange', 'gold', 'green', 'blue', 'indigo', 'violet']
+    TOTAL_FINGERPRINTS = 100
+    
+    def __init__(self, fingerprint_width: float, fingerprint_height: float, 
+                 band_spacing_percent: float = 100.0, min_inner_prints: int = 5):
+        """
+        Initialize with fingerprint dimensions
+        
+        Args:
+            fingerprint_width: Width of fingerprint in inches (short axis)
+            fingerprint_height: Height of fingerprint in inches (long axis)
+            band_spacing_percent: Percentage of fingerprint height for band spacing (default 100%)
+            min_inner_prints: Minimum number of fingerprints for innermost band (default 5)
+        """
+        self.fp_width = fingerprint_width
+        self.fp_height = fingerprint_height
+        self.band_spacing_percent = band_spacing_percent
+        self.min_inner_prints = min_inner_prints
+        
+        # Band geometry, dimensions and allocation are memoized on the constructor
+        # arguments, so rebuilding an identical rainbow skips the computation entirely
+        self.band_spacing, mid_radii, self.width, self.height, allocations = _compute_layout(
+            fingerprint_width, fingerprint_height, band_spacing_percent,
+            min_inner_prints, self.TOTAL_FINGERPRINTS)
+        
+        # Radius to the center of each band, red (outermost) to violet (innermost)
+        self.mid_radii = np.array(mid_radii)
+        self.allocations = list(allocations)
+        
+    def calculate_dimensions(self) -> Tuple[float, float]:
+        """
+        Get the total width and height of the rainbow, computed once in __init__
+        
+        Returns:
+            (width, height) in inches
+        """
+        return self.width, self.height
+    
+    def get_band_radii(self) -> List[Tuple[str, float, float, float]]:
+        """
+        Get the inner, middle, and outer radii for each band
+        
+        Returns:
+            List of (color, inner_radius, mid_radius, outer_radius) tuples
+        """
+        radii = []
+        for color, mid_radius in zip(self.COLORS, self.mid_radii.tolist()):
+            inner_radius = mid_radius - self.fp_width / 2
+            outer_radius = mid_radius + self.fp_width / 2
+            radii.append((color, inner_radius, mid_radius, outer_radius))
+        return radii
+    
+    def render(self, ax: "Axes", paper_width: float, paper_height: float, 
+               margin: float, orientation: str = "portrait", show_radii: bool = False) -> "RainbowArtists":
+        """Render this rainbow on a matplotlib axes, see render.render_rainbow()"""
+        # The render module is imported on use so the core stays importable without matplotlib
+        from .render import render_rainbow
+        return render_rainbow(self, ax, paper_width, paper_height, margin, orientation, show_radii)
+    
+    def update(self, artists: "RainbowArtists", paper_width: float, paper_height: float, 
+               margin: float, orientation: str = "portrait", show_radii: bool = False):
+        """Update existing rainbow artists to show this rainbow, see render.update_artists()"""
+        from .render import update_artists
+        update_artists(self, artists, paper_width, paper_height, margin, orientation, show_radii)
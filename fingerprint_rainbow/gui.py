@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Fingerprint Rainbow Optimizer and Visualizer
 A GUI application to optimize and visualize fingerprint placement on rainbow bands
@@ -8,297 +7,35 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Ellipse, Wedge
-import numpy as np
-from dataclasses import dataclass
+from matplotlib.artist import Artist
+from matplotlib.patches import Wedge
 from typing import List, Tuple, Optional
-import math
-import shutil
 
-
-@dataclass
-class PaperSize:
-    """Represents a paper size with name and dimensions in inches"""
-    name: str
-    width: float  # inches
-    height: float  # inches
-
-
-# Standard paper sizes
-PAPER_SIZES = {
-    "40x60 Poster (US)": PaperSize("40x60 Poster (US)", 40, 60),
-    "20x30 Poster (US)": PaperSize("20x30 Poster (US)", 20, 30),
-    "Letter (US)": PaperSize("Letter (US)", 8.5, 11),
-    "Legal (US)": PaperSize("Legal (US)", 8.5, 14),
-    "Tabloid (US)": PaperSize("Tabloid (US)", 11, 17),
-    "A4": PaperSize("A4", 8.27, 11.69),
-    "A3": PaperSize("A3", 11.69, 16.54),
-    "A2": PaperSize("A2", 16.54, 23.39),
-    "A1": PaperSize("A1", 23.39, 33.11),
-    "Custom": PaperSize("Custom", 8.5, 11)
-}
-
-
-class FingerprintRainbow:
-    """Core logic for fingerprint rainbow calculation and rendering"""
-    
-    # Colors from outermost (largest) to innermost (smallest)
-    COLORS = ['red', 'orange', 'gold', 'green', 'blue', 'indigo', 'violet']
-    TOTAL_FINGERPRINTS = 100
-    
-    def __init__(self, fingerprint_width: float, fingerprint_height: float, 
-                 band_spacing_percent: float = 100.0, min_inner_prints: int = 5):
-        """
-        Initialize with fingerprint dimensions
-        
-        Args:
-            fingerprint_width: Width of fingerprint in inches (short axis)
-            fingerprint_height: Height of fingerprint in inches (long axis)
-            band_spacing_percent: Percentage of fingerprint height for band spacing (default 100%)
-            min_inner_prints: Minimum number of fingerprints for innermost band (default 5)
-        """
-        self.fp_width = fingerprint_width
-        self.fp_height = fingerprint_height
-        self.band_spacing_percent = band_spacing_percent
-        self.band_spacing = (band_spacing_percent / 100.0) * fingerprint_height
-        self.min_inner_prints = min_inner_prints
-        self.allocations = self._optimize_allocation()
-        
-    def _optimize_allocation(self) -> List[int]:
-        """
-        Optimize fingerprint allocation across bands.
-        Each band is a half-circle, so larger radius = more fingerprints can fit.
-        Red (outermost) should have the most, violet (innermost) should have the least.
-        Fingerprints are placed tangent to their neighbors.
-        Respects minimum fingerprint count for innermost band.
-        """
-        # Calculate how many fingerprints fit in each band based on arc length
-        # Band 0 (red) is outermost with largest radius
-        # Band 6 (violet) is innermost with smallest radius
-        band_capacities = []
-        
-        # Start with the innermost band (violet) and work outward
-        # Each band is separated by band_spacing
-        for i in range(7):
-            # Band index from innermost: violet=0, indigo=1, ..., red=6
-            # But we need to iterate in the order we store (red=0, violet=6)
-            # So band_idx in storage is (6-i)
-            
-            # Calculate radius for this band (measured to center of band)
-            # Innermost band (violet, storage idx 6) starts at band_spacing/2
-            # Each successive band is separated by band_spacing
-            band_from_center = 6 - i  # violet=0, indigo=1, ..., red=6
-            mid_radius = self.band_spacing / 2 + band_from_center * self.band_spacing
-            
-            # Arc length at this radius
-            arc_length = math.pi * mid_radius
-            
-            # Number of fingerprints that fit tangent to each other
-            # Each fingerprint takes up fp_height of arc length
-            num_fits = arc_length / self.fp_height
-            
-            band_capacities.append(num_fits)
-        
-        # Normalize to 100 total fingerprints
-        total_capacity = sum(band_capacities)
-        allocations = [round(w / total_capacity * self.TOTAL_FINGERPRINTS) for w in band_capacities]
-        
-        # Ensure innermost band (violet, index 6) meets minimum requirement
-        if allocations[6] < self.min_inner_prints:
-            # Need to add fingerprints to innermost band
-            deficit = self.min_inner_prints - allocations[6]
-            allocations[6] = self.min_inner_prints
-            
-            # Remove from other bands proportionally (prioritize outer bands)
-            remaining_total = self.TOTAL_FINGERPRINTS - self.min_inner_prints
-            remaining_capacity = sum(band_capacities[:6])
-            
-            for i in range(6):
-                if remaining_capacity > 0:
-                    proportion = band_capacities[i] / remaining_capacity
-                    allocations[i] = round(proportion * remaining_total)
-        
-        # Final adjustment to ensure exactly 100
-        diff = self.TOTAL_FINGERPRINTS - sum(allocations)
-        if diff != 0:
-            # Add/subtract from the band with most capacity (but not innermost if we just set it)
-            candidates = list(range(6)) if allocations[6] == self.min_inner_prints else list(range(7))
-            if candidates:
-                max_idx = max(candidates, key=lambda i: allocations[i])
-                allocations[max_idx] += diff
-        
-        return allocations
-    
-    def calculate_dimensions(self) -> Tuple[float, float]:
-        """
-        Calculate the total width and height of the rainbow
-        
-        Returns:
-            (width, height) in inches
-        """
-        # Total radius includes all 7 bands plus the outer half of the outermost band
-        # Each band is centered at: band_spacing/2 + band_num * band_spacing
-        # Outermost band (red, band 6 from center) is at: band_spacing/2 + 6 * band_spacing
-        # Plus we need to add fp_width/2 for the outer edge
-        outermost_center = self.band_spacing / 2 + 6 * self.band_spacing
-        total_radius = outermost_center + self.fp_width / 2
-        width = 2 * total_radius
-        height = total_radius  # Half circle
-        return width, height
-    
-    def get_band_radii(self) -> List[Tuple[str, float, float, float]]:
-        """
-        Get the inner, middle, and outer radii for each band
-        
-        Returns:
-            List of (color, inner_radius, mid_radius, outer_radius) tuples
-        """
-        radii = []
-        for band_idx, color in enumerate(self.COLORS):
-            band_from_center = 6 - band_idx
-            mid_radius = self.band_spacing / 2 + band_from_center * self.band_spacing
-            inner_radius = mid_radius - self.fp_width / 2
-            outer_radius = mid_radius + self.fp_width / 2
-            radii.append((color, inner_radius, mid_radius, outer_radius))
-        return radii
-    
-    def render(self, ax: plt.Axes, paper_width: float, paper_height: float, 
-               margin: float, orientation: str = "portrait", show_radii: bool = False):
-        """
-        Render the rainbow visualization on a matplotlib axes
-        
-        Args:
-            ax: Matplotlib axes to render on
-            paper_width: Paper width in inches
-            paper_height: Paper height in inches
-            margin: Margin size in inches
-            orientation: "portrait" or "landscape"
-            show_radii: If True, show radius measurements on the visualization
-        """
-        ax.clear()
-        ax.set_aspect('equal')
-        
-        # Swap dimensions if landscape
-        if orientation == "landscape":
-            paper_width, paper_height = paper_height, paper_width
-        
-        # Set up the plot with margins
-        ax.set_xlim(0, paper_width)
-        ax.set_ylim(0, paper_height)
-        
-        # Draw margin lines (light gray)
-        margin_rect = plt.Rectangle((margin, margin), 
-                                    paper_width - 2*margin, 
-                                    paper_height - 2*margin,
-                                    fill=False, edgecolor='lightgray', 
-                                    linestyle='--', linewidth=1)
-        ax.add_patch(margin_rect)
-        
-        # Calculate rainbow dimensions
-        rainbow_width, rainbow_height = self.calculate_dimensions()
-        
-        # Center the rainbow on the paper (horizontally) and position from bottom margin
-        center_x = paper_width / 2
-        center_y = margin
-        
-        # Draw each band - band 0 (red) is outermost, band 6 (violet) is innermost
-        for band_idx, (color, num_prints) in enumerate(zip(self.COLORS, self.allocations)):
-            # Calculate band position from center
-            # band_idx: 0=red (outermost), 6=violet (innermost)
-            # band_from_center: 6=red, 0=violet
-            band_from_center = 6 - band_idx
-            
-            # Mid radius for this band
-            mid_radius = self.band_spacing / 2 + band_from_center * self.band_spacing
-            
-            # Inner and outer radius for the band wedge
-            inner_radius = mid_radius - self.fp_width / 2
-            outer_radius = mid_radius + self.fp_width / 2
-            
-            # Draw the band as a wedge (semi-circle)
-            wedge = Wedge((center_x, center_y), outer_radius, 0, 180,
-                         width=self.fp_width, facecolor=color, alpha=0.3,
-                         edgecolor='black', linewidth=0.5)
-            ax.add_patch(wedge)
-            
-            # Show radii if requested
-            if show_radii:
-                # Draw radius line from center to right edge
-                line_angle = 0  # Horizontal right
-                line_x = center_x + mid_radius * math.cos(line_angle)
-                line_y = center_y + mid_radius * math.sin(line_angle)
-                ax.plot([center_x, line_x], [center_y, line_y], 
-                       color=color, linewidth=1.5, linestyle='-', alpha=0.7)
-                
-                # Add radius label
-                label_x = center_x + (mid_radius * 0.5) * math.cos(line_angle)
-                label_y = center_y + (mid_radius * 0.5) * math.sin(line_angle) + 0.1
-                ax.text(label_x, label_y, f'{mid_radius:.2f}"', 
-                       fontsize=8, ha='center', va='bottom',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=color))
-            
-            # Place fingerprints on this band, tangent to each other
-            if num_prints > 0:
-                for i in range(num_prints):
-                    # Calculate angle for this fingerprint
-                    # Fingerprints are evenly distributed and tangent to neighbors
-                    # Each fingerprint occupies fp_height of arc length
-                    arc_per_print = math.pi * mid_radius / num_prints
-                    
-                    # Center angle of this fingerprint
-                    angle = (i + 0.5) * arc_per_print / mid_radius
-                    
-                    # Position on the arc (center of ellipse on mid_radius)
-                    x = center_x + mid_radius * math.cos(angle)
-                    y = center_y + mid_radius * math.sin(angle)
-                    
-                    # The major axis (fp_height) should be aligned with the radius
-                    # The minor axis (fp_width) should be tangent to the circle (perpendicular to radius)
-                    # Angle points from center outward, so major axis should be at that angle
-                    # In matplotlib Ellipse, angle is in degrees, measured counter-clockwise from horizontal
-                    # The angle of the radius at this position is 'angle' (in radians)
-                    rotation_deg = math.degrees(angle)
-                    
-                    # Draw fingerprint as ellipse
-                    # width = major axis (along radius) = fp_height
-                    # height = minor axis (tangent to circle) = fp_width
-                    ellipse = Ellipse((x, y), self.fp_height, self.fp_width,
-                                    angle=rotation_deg, 
-                                    facecolor='none', edgecolor='black',
-                                    linewidth=0.5, alpha=0.7)
-                    ax.add_patch(ellipse)
-        
-        # Add title with allocation info
-        allocation_str = " | ".join([f"{c[:3]}: {n}" for c, n in zip(self.COLORS, self.allocations)])
-        title_str = f"Fingerprint Rainbow (Band Spacing: {self.band_spacing_percent:.0f}%, Min Inner: {self.min_inner_prints})"
-        if show_radii:
-            title_str += " - Radii Shown"
-        ax.set_title(f"{title_str}\n{allocation_str}", 
-                    fontsize=9, pad=10)
-        
-        # Remove axes
-        orientation_label = orientation.capitalize()
-        ax.set_xlabel(f"Paper: {paper_width:.2f}\" × {paper_height:.2f}\" ({orientation_label}) | Margins: {margin:.2f}\"")
-        ax.set_xticks([])
-        ax.set_yticks([])
+from .core import (FingerprintRainbow, PAPER_SIZES, STANDARD_PAPER_NAMES, STANDARD_PAPER_WIDTHS,
+                   STANDARD_PAPER_HEIGHTS, paper_fits)
+from .render import create_artists
 
 
 class FingerprintRainbowGUI:
     """Main GUI application"""
     
+    # Delay before re-rendering after the last slider movement (milliseconds)
+    RENDER_DEBOUNCE_MS = 50
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Fingerprint Rainbow Optimizer")
         self.root.geometry("1200x800")
         
         # Default fingerprint dimensions (inches) - child's fingerprint
-        self.fp_width_var = tk.StringVar(value="0.4")  # Short axis
-        self.fp_height_var = tk.StringVar(value="0.6")  # Long axis
+        self.fp_width_var = tk.DoubleVar(value=0.4)  # Short axis
+        self.fp_height_var = tk.DoubleVar(value=0.6)  # Long axis
         
         # Band spacing percentage (percentage of fingerprint height)
         self.band_spacing_var = tk.DoubleVar(value=100.0)
         
         # Minimum fingerprints for innermost circle
+        # Kept as text: IntVar.get() would silently truncate "5.9" to 5
         self.min_inner_var = tk.StringVar(value="5")
         
         # Paper orientation
@@ -309,14 +46,20 @@ class FingerprintRainbowGUI:
         
         # Paper size variables
         self.paper_size_var = tk.StringVar(value="Letter (US)")
-        self.paper_width_var = tk.StringVar(value="8.5")
-        self.paper_height_var = tk.StringVar(value="11")
-        self.margin_var = tk.StringVar(value="1.5")
+        self.paper_width_var = tk.DoubleVar(value=8.5)
+        self.paper_height_var = tk.DoubleVar(value=11)
+        self.margin_var = tk.DoubleVar(value=1.5)
         self.auto_paper_size = tk.BooleanVar(value=False)
         
         # Rainbow object
         self.rainbow: Optional[FingerprintRainbow] = None
         
+        # Paper the rainbow was last generated for: (name, width, height, margin, orientation)
+        self._paper_layout: Optional[Tuple[str, float, float, float, str]] = None
+        
+        # Pending debounced re-render (Tk after() id)
+        self._pending_render: Optional[str] = None
+        
         # Build GUI
         self._build_gui()
         
@@ -374,19 +117,85 @@ class FingerprintRainbowGUI:
         # Matplotlib figure with non-interactive backend
         plt.ioff()  # Turn off interactive mode
         self.fig, self.ax = plt.subplots(figsize=(10, 8))
+        
+        # Fixed axes placement with no layout engine, leaving room for the
+        # two-line title and the paper label, so renders never re-run layout
+        if hasattr(self.fig, 'set_layout_engine'):
+            self.fig.set_layout_engine('none')
+        else:  # matplotlib < 3.6
+            self.fig.set_tight_layout(False)
+            self.fig.set_constrained_layout(False)
+        self.ax.set_position([0.05, 0.06, 0.9, 0.86])
+        
         self.canvas = FigureCanvasTkAgg(self.fig, master=viz_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
         
+        # Rainbow artists are created once and updated in place on each render.
+        # They are animated so a full draw only paints the static background,
+        # which is cached for blitting in _on_draw.
+        self.rainbow_artists = create_artists(self.ax)
+        for artist in self._animated_artists():
+            artist.set_animated(True)
+        
+        # Cached background and the view state it was captured with
+        self._background = None
+        self._background_key = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
         # Initial message
-        self.ax.text(0.5, 0.5, 'Click "Generate Rainbow" to start', 
-                    ha='center', va='center', fontsize=14, color='gray')
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
+        self.placeholder_text = self.ax.text(0.5, 0.5, 'Click "Generate Rainbow" to start', 
+                                             ha='center', va='center', fontsize=14, color='gray',
+                                             transform=self.ax.transAxes)
         self.canvas.draw()
     
+    def _animated_artists(self) -> List[Artist]:
+        """Artists redrawn on top of the cached background when blitting"""
+        artists = self.rainbow_artists
+        # Spines come last so the axes frame stays on top of the bands, as in a full draw
+        return [artists.margin_rect, artists.bands, artists.fingerprints,
+                *artists.radii, *self.ax.spines.values(), artists.title]
+    
+    def _view_key(self) -> Tuple:
+        """State of the non-animated parts of the figure that the background depends on"""
+        return (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_xlabel())
+    
+    def _on_draw(self, event):
+        """Cache the background after a full draw, then paint the animated artists"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._background_key = self._view_key()
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+    
+    def _draw_animated(self):
+        """Draw the animated artists onto the canvas"""
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+    
+    def _refresh_canvas(self):
+        """
+        Show the updated rainbow, blitting it over the cached background when
+        the paper, orientation and margins are unchanged and scheduling a full
+        redraw otherwise
+        """
+        # Radius lines and labels are recreated on every update
+        for artist in self.rainbow_artists.radii:
+            artist.set_animated(True)
+        
+        if self._background is not None and self._background_key == self._view_key():
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw_idle()
+    
     def _on_closing(self):
         """Handle window close event properly"""
         try:
+            # Drop any pending re-render so it doesn't fire on a destroyed window
+            if self._pending_render is not None:
+                self.root.after_cancel(self._pending_render)
+                self._pending_render = None
+            
             # Close matplotlib figure
             plt.close(self.fig)
         except:
@@ -569,32 +378,55 @@ class FingerprintRainbowGUI:
         
     def _set_child_default(self):
         """Set child fingerprint defaults"""
-        self.fp_width_var.set("0.4")
-        self.fp_height_var.set("0.6")
+        self.fp_width_var.set(0.4)
+        self.fp_height_var.set(0.6)
         
     def _set_adult_default(self):
         """Set adult fingerprint defaults"""
-        self.fp_width_var.set("0.5")
-        self.fp_height_var.set("0.8")
+        self.fp_width_var.set(0.5)
+        self.fp_height_var.set(0.8)
     
     def _on_spacing_changed(self, value):
-        """Update spacing label when slider changes"""
+        """Update spacing label when slider changes and schedule a re-render"""
         self.spacing_label.config(text=f"{self.band_spacing_var.get():.0f}%")
+        
+        # Coalesce a burst of slider events into a single render once dragging pauses
+        if self._pending_render is not None:
+            self.root.after_cancel(self._pending_render)
+        self._pending_render = self.root.after(self.RENDER_DEBOUNCE_MS, self._do_render)
+    
+    def _do_render(self):
+        """
+        Redraw the shown rainbow with the slider's band spacing
+        
+        Runs on every pause in a slider drag, so unlike _generate_rainbow it
+        never shows a dialog or picks a new paper size: everything except the
+        band spacing is kept from the last Generate.
+        """
+        self._pending_render = None
+        if self._paper_layout is None:
+            return  # Nothing generated yet
+        
+        paper_name, paper_width, paper_height, margin, orientation = self._paper_layout
+        self.rainbow = FingerprintRainbow(self.rainbow.fp_width, self.rainbow.fp_height,
+                                          self.band_spacing_var.get(), self.rainbow.min_inner_prints)
+        self.rainbow.update(self.rainbow_artists, paper_width, paper_height, margin, 
+                            orientation, self.show_radii_var.get())
+        self._refresh_canvas()
+        self._update_info(paper_name, paper_width, paper_height, margin, orientation)
     
     def _on_show_radii_changed(self):
         """Regenerate visualization when show radii checkbox changes"""
         if self.rainbow is not None:
             try:
-                fp_width = float(self.fp_width_var.get())
-                fp_height = float(self.fp_height_var.get())
-                margin = float(self.margin_var.get())
+                margin = self.margin_var.get()
                 orientation = self.orientation_var.get()
-                paper_width = float(self.paper_width_var.get())
-                paper_height = float(self.paper_height_var.get())
+                paper_width = self.paper_width_var.get()
+                paper_height = self.paper_height_var.get()
                 
-                self.rainbow.render(self.ax, paper_width, paper_height, margin, 
-                                  orientation, self.show_radii_var.get())
-                self.canvas.draw()
+                self.rainbow.update(self.rainbow_artists, paper_width, paper_height, margin, 
+                                    orientation, self.show_radii_var.get())
+                self._refresh_canvas()
             except:
                 pass  # If there's an error, just don't update
         
@@ -624,8 +456,8 @@ class FingerprintRainbowGUI:
             self.paper_width_entry.configure(state='normal')
             self.paper_height_entry.configure(state='normal')
         else:
-            self.paper_width_var.set(str(paper_size.width))
-            self.paper_height_var.set(str(paper_size.height))
+            self.paper_width_var.set(paper_size.width)
+            self.paper_height_var.set(paper_size.height)
             self.paper_width_entry.configure(state='disabled')
             self.paper_height_entry.configure(state='disabled')
     
@@ -646,40 +478,44 @@ class FingerprintRainbowGUI:
         required_width = rainbow_width + 2 * margin
         required_height = rainbow_height + 2 * margin
         
-        # Sort paper sizes by area
-        suitable_sizes = []
-        for name, paper in PAPER_SIZES.items():
-            if name == "Custom":
-                continue
-            
-            # Check if paper fits in the requested orientation
-            if orientation == "portrait":
-                fits = paper.width >= required_width and paper.height >= required_height
-                actual_width, actual_height = paper.width, paper.height
-            else:  # landscape
-                fits = paper.height >= required_width and paper.width >= required_height
-                actual_width, actual_height = paper.height, paper.width
-            
-            if fits:
-                area = paper.width * paper.height
-                suitable_sizes.append((area, name, actual_width, actual_height))
-        
-        if suitable_sizes:
-            suitable_sizes.sort()  # Sort by area
-            return suitable_sizes[0][1], suitable_sizes[0][2], suitable_sizes[0][3]
-        else:
+        fits = paper_fits(required_width, required_height, orientation)
+        if not fits.any():
             # No standard size fits, return custom size
             return "Custom", required_width, required_height
+        
+        # Papers are sorted by area, so the first one that fits is the smallest
+        idx = int(fits.argmax())
+        width, height = float(STANDARD_PAPER_WIDTHS[idx]), float(STANDARD_PAPER_HEIGHTS[idx])
+        if orientation == "portrait":
+            return STANDARD_PAPER_NAMES[idx], width, height
+        else:  # landscape
+            return STANDARD_PAPER_NAMES[idx], height, width
+    
+    @staticmethod
+    def _get_number(var: tk.Variable, label: str):
+        """Read a numeric Tk variable, reporting unparsable entry text as a ValueError"""
+        try:
+            return var.get()
+        except tk.TclError:
+            raise ValueError(f"{label} must be a number") from None
+    
+    @staticmethod
+    def _get_int(var: tk.StringVar, label: str) -> int:
+        """Parse a whole-number entry, reporting any other text (such as "5.9") as a ValueError"""
+        try:
+            return int(var.get())
+        except ValueError:
+            raise ValueError(f"{label} must be a whole number") from None
     
     def _generate_rainbow(self):
         """Generate and visualize the rainbow"""
         try:
-            # Parse inputs
-            fp_width = float(self.fp_width_var.get())
-            fp_height = float(self.fp_height_var.get())
-            margin = float(self.margin_var.get())
-            band_spacing_percent = float(self.band_spacing_var.get())
-            min_inner = int(self.min_inner_var.get())
+            # Read inputs
+            fp_width = self._get_number(self.fp_width_var, "Fingerprint width")
+            fp_height = self._get_number(self.fp_height_var, "Fingerprint height")
+            margin = self._get_number(self.margin_var, "Margin")
+            band_spacing_percent = self.band_spacing_var.get()
+            min_inner = self._get_int(self.min_inner_var, "Minimum inner fingerprints")
             orientation = self.orientation_var.get()
             
             if fp_width <= 0 or fp_height <= 0 or margin < 0:
@@ -701,11 +537,11 @@ class FingerprintRainbowGUI:
                     rainbow_width, rainbow_height, margin, orientation
                 )
                 self.paper_size_var.set(paper_name)
-                self.paper_width_var.set(f"{paper_width:.2f}")
-                self.paper_height_var.set(f"{paper_height:.2f}")
+                self.paper_width_var.set(round(paper_width, 2))
+                self.paper_height_var.set(round(paper_height, 2))
             else:
-                paper_width = float(self.paper_width_var.get())
-                paper_height = float(self.paper_height_var.get())
+                paper_width = self._get_number(self.paper_width_var, "Paper width")
+                paper_height = self._get_number(self.paper_height_var, "Paper height")
                 paper_name = self.paper_size_var.get()
             
             # Check if rainbow fits (considering orientation)
@@ -720,38 +556,55 @@ class FingerprintRainbowGUI:
                     f"Consider enabling auto-paper size or using larger paper.")
             
             # Render
-            self.rainbow.render(self.ax, paper_width, paper_height, margin, 
-                              orientation, self.show_radii_var.get())
-            self.canvas.draw()
+            if self.placeholder_text.get_visible():
+                # The cached background still shows the placeholder
+                self.placeholder_text.set_visible(False)
+                self._background = None
+            self.rainbow.update(self.rainbow_artists, paper_width, paper_height, margin, 
+                                orientation, self.show_radii_var.get())
+            self._refresh_canvas()
             
-            # Get band radii
-            band_radii = self.rainbow.get_band_radii()
-            
-            # Update info
-            info_text = (
-                f"Rainbow Dimensions:\n"
-                f"  {rainbow_width:.2f}\" × {rainbow_height:.2f}\"\n\n"
-                f"Paper Size: {paper_name}\n"
-                f"  {paper_width:.2f}\" × {paper_height:.2f}\"\n"
-                f"  Orientation: {orientation.capitalize()}\n\n"
-                f"Band Spacing: {band_spacing_percent:.0f}%\n"
-                f"Min Inner: {min_inner}\n\n"
-                f"Fingerprint Allocation:\n"
-            )
-            for color, count in zip(FingerprintRainbow.COLORS, self.rainbow.allocations):
-                info_text += f"  {color.capitalize()}: {count}\n"
-            
-            info_text += "\nBand Radii (inches):\n"
-            for color, inner, mid, outer in band_radii:
-                info_text += f"  {color.capitalize()}: {mid:.2f}\" (±{self.fp_width/2:.2f}\")\n"
-            
-            self.info_label.config(text=info_text)
+            self._paper_layout = (paper_name, paper_width, paper_height, margin, orientation)
+            self._update_info(paper_name, paper_width, paper_height, margin, orientation)
             
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
     
+    def _update_info(self, paper_name: str, paper_width: float, paper_height: float, 
+                     margin: float, orientation: str):
+        """Show the current rainbow's dimensions, allocation and band radii in the info panel"""
+        rainbow_width, rainbow_height = self.rainbow.calculate_dimensions()
+        
+        # Get band radii
+        band_radii = self.rainbow.get_band_radii()
+        
+        half_width = self.rainbow.fp_width / 2
+        allocation_lines = "\n".join(
+            f"  {color.capitalize()}: {count}"
+            for color, count in zip(FingerprintRainbow.COLORS, self.rainbow.allocations)
+        )
+        radii_lines = "\n".join(
+            f"  {color.capitalize()}: {mid:.2f}\" (±{half_width:.2f}\")"
+            for color, inner, mid, outer in band_radii
+        )
+        info_text = (
+            f"Rainbow Dimensions:\n"
+            f"  {rainbow_width:.2f}\" × {rainbow_height:.2f}\"\n\n"
+            f"Paper Size: {paper_name}\n"
+            f"  {paper_width:.2f}\" × {paper_height:.2f}\"\n"
+            f"  Orientation: {orientation.capitalize()}\n\n"
+            f"Band Spacing: {self.rainbow.band_spacing_percent:.0f}%\n"
+            f"Min Inner: {self.rainbow.min_inner_prints}\n\n"
+            f"Fingerprint Allocation:\n"
+            f"{allocation_lines}\n\n"
+            f"Band Radii (inches):\n"
+            f"{radii_lines}\n"
+        )
+        
+        self.info_label.config(text=info_text)
+    
     def _generate_construction_sheet(self):
         """Generate a construction reference sheet on 8.5x11 paper"""
         if self.rainbow is None:
@@ -761,14 +614,14 @@ class FingerprintRainbowGUI:
         
         try:
             # Get current parameters
-            fp_width = float(self.fp_width_var.get())
-            fp_height = float(self.fp_height_var.get())
-            margin = float(self.margin_var.get())
-            band_spacing_percent = float(self.band_spacing_var.get())
-            min_inner = int(self.min_inner_var.get())
+            fp_width = self.fp_width_var.get()
+            fp_height = self.fp_height_var.get()
+            margin = self.margin_var.get()
+            band_spacing_percent = self.band_spacing_var.get()
+            min_inner = self.rainbow.min_inner_prints
             orientation = self.orientation_var.get()
-            paper_width = float(self.paper_width_var.get())
-            paper_height = float(self.paper_height_var.get())
+            paper_width = self.paper_width_var.get()
+            paper_height = self.paper_height_var.get()
             paper_name = self.paper_size_var.get()
             
             # Create a new figure for the construction sheet
@@ -831,10 +684,11 @@ class FingerprintRainbowGUI:
             center_x = available_width / 2
             center_y = 0.2
             
+            band_radii = self.rainbow.get_band_radii()
+            
             # Draw each band at scale
-            for band_idx, (color, num_prints) in enumerate(zip(self.rainbow.COLORS, self.rainbow.allocations)):
-                band_from_center = 6 - band_idx
-                mid_radius = (self.rainbow.band_spacing / 2 + band_from_center * self.rainbow.band_spacing) * scale
+            for color, _, actual_mid_radius, _ in band_radii:
+                mid_radius = actual_mid_radius * scale
                 inner_radius = mid_radius - (self.rainbow.fp_width / 2) * scale
                 outer_radius = mid_radius + (self.rainbow.fp_width / 2) * scale
                 
@@ -864,8 +718,6 @@ class FingerprintRainbowGUI:
             ax3 = fig_sheet.add_subplot(gs[2])
             ax3.axis('off')
             
-            band_radii = self.rainbow.get_band_radii()
-            
             table_text = "BAND SPECIFICATIONS\n" + "=" * 60 + "\n\n"
             table_text += f"{'Band':<10} {'Color':<10} {'Fingerprints':<15} {'Radius (in)':<20}\n"
             table_text += "-" * 60 + "\n"
@@ -902,7 +754,3 @@ def main():
     root = tk.Tk()
     app = FingerprintRainbowGUI(root)
     root.mainloop()
-
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,279 @@
+"""
+Fingerprint Rainbow rendering: draws a FingerprintRainbow with matplotlib artists
+
+Uses matplotlib's object API only, so importing it does not load pyplot or a GUI backend.
+"""
+
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.patches import Rectangle
+from matplotlib.path import Path
+from matplotlib.text import Text
+from matplotlib.collections import EllipseCollection, PathCollection
+from matplotlib.colors import to_rgba
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Tuple
+import math
+
+from .core import FingerprintRainbow
+
+
+# Abbreviated color names for the allocation summary in the title
+_SHORT_COLORS = tuple(color[:3] for color in FingerprintRainbow.COLORS)
+
+# Band colors resolved to RGBA once, so rendering never looks up color names
+_COLOR_RGBA = np.array([to_rgba(color) for color in FingerprintRainbow.COLORS])
+
+# Unit half circle (0 to 180 degrees) and the path codes for a band built from it
+_HALF_ARC = Path.arc(0, 180)
+_BAND_PATH_CODES = np.concatenate([_HALF_ARC.codes, _HALF_ARC.codes, [Path.CLOSEPOLY]])
+_BAND_PATH_CODES[len(_HALF_ARC.codes)] = Path.LINETO
+
+# EllipseCollection can only be resized and rotated in place from matplotlib 3.9;
+# on older versions update_artists() replaces the collection instead
+_ELLIPSE_SETTERS = hasattr(EllipseCollection, 'set_widths')
+
+
+def _band_xy(radii: np.ndarray, counts: np.ndarray,
+             center_x: float, center_y: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute fingerprint positions for all bands at once
+    
+    Fingerprints are evenly distributed along each band's half circle and
+    tangent to their neighbors: each one occupies an equal share of the
+    half circle and is centered within its share.
+    
+    Args:
+        radii: Mid radius of each band
+        counts: Number of fingerprints on each band (bands with none are skipped)
+        center_x: X coordinate of the rainbow center
+        center_y: Y coordinate of the rainbow center
+    
+    Returns:
+        (offsets, angles): an (N, 2) array of fingerprint centers and the
+        angle of each from the center, in radians
+    """
+    counts = np.maximum(counts, 0)
+    
+    # Expand per-band values to one entry per fingerprint
+    print_radii = np.repeat(radii, counts)
+    print_counts = np.repeat(counts, counts)
+    
+    # Index of each fingerprint within its own band
+    band_starts = np.cumsum(counts) - counts
+    index_in_band = np.arange(counts.sum()) - np.repeat(band_starts, counts)
+    
+    angles = (index_in_band + 0.5) * (math.pi / print_counts)
+    
+    # Position on the arc (center of ellipse on the band's mid radius)
+    offsets = np.column_stack([
+        center_x + print_radii * np.cos(angles),
+        center_y + print_radii * np.sin(angles),
+    ])
+    return offsets, angles
+
+
+def _fingerprint_collection(ax: Axes, widths: np.ndarray, heights: np.ndarray,
+                            angles: np.ndarray, offsets: np.ndarray) -> EllipseCollection:
+    """
+    Add fingerprint ellipses, positioned and sized in data coordinates
+    
+    Args:
+        ax: Matplotlib axes to draw on
+        widths: Full length of each ellipse's first axis
+        heights: Full length of each ellipse's second axis
+        angles: Rotation of each ellipse in degrees, counter-clockwise from horizontal
+        offsets: (N, 2) array of ellipse centers
+        
+    Returns:
+        The collection, already added to the axes
+    """
+    fingerprints = EllipseCollection(widths, heights, angles, units='xy', offsets=offsets,
+                                     facecolors='none', edgecolors='black',
+                                     linewidths=0.5, alpha=0.7)
+    # Set after construction: the keyword for it was renamed in matplotlib 3.6
+    fingerprints.set_offset_transform(ax.transData)
+    ax.add_collection(fingerprints, autolim=False)
+    return fingerprints
+
+
+@dataclass
+class RainbowArtists:
+    """Matplotlib artists drawing a rainbow, kept so later renders can reuse them"""
+    ax: Axes
+    margin_rect: Rectangle
+    bands: PathCollection
+    fingerprints: EllipseCollection
+    title: Text
+    radii: List[Artist] = field(default_factory=list)  # radius lines and labels
+
+
+def render_rainbow(rainbow: FingerprintRainbow, ax: Axes, paper_width: float, paper_height: float,
+                   margin: float, orientation: str = "portrait", show_radii: bool = False) -> RainbowArtists:
+    """
+    Render a rainbow visualization on a matplotlib axes
+    
+    Clears the axes and creates fresh artists. To redraw repeatedly on the
+    same axes, keep the returned artists and pass them to update_artists() instead.
+    
+    Args:
+        rainbow: Rainbow to draw
+        ax: Matplotlib axes to render on
+        paper_width: Paper width in inches
+        paper_height: Paper height in inches
+        margin: Margin size in inches
+        orientation: "portrait" or "landscape"
+        show_radii: If True, show radius measurements on the visualization
+    
+    Returns:
+        The artists drawing the rainbow, reusable with update_artists()
+    """
+    ax.clear()
+    artists = create_artists(ax)
+    update_artists(rainbow, artists, paper_width, paper_height, margin, orientation, show_radii)
+    return artists
+
+
+def create_artists(ax: Axes) -> RainbowArtists:
+    """
+    Add empty, persistent rainbow artists to a matplotlib axes
+    
+    Args:
+        ax: Matplotlib axes to draw on
+    
+    Returns:
+        The artists, to be filled in by update_artists()
+    """
+    ax.set_aspect('equal')
+    ax.set_xticks([])
+    ax.set_yticks([])
+    
+    # update_artists() always sets explicit limits, so adding or changing
+    # artists never needs to rescale the view
+    ax.set_autoscale_on(False)
+    
+    # Margin lines (light gray)
+    margin_rect = Rectangle((0, 0), 0, 0,
+                            fill=False, edgecolor='lightgray',
+                            linestyle='--', linewidth=1)
+    ax.add_patch(margin_rect)
+    
+    # One semi-circular wedge per band, colored outermost to innermost
+    # Fill only: the fingerprint outlines already mark out each band
+    bands = PathCollection([], facecolors=_COLOR_RGBA, alpha=0.3,
+                           edgecolors='none', linewidths=0)
+    ax.add_collection(bands, autolim=False)
+    
+    # Fingerprint ellipses, placed by update_artists()
+    fingerprints = _fingerprint_collection(ax, [], [], [], np.empty((0, 2)))
+    
+    # Title with allocation info, text filled in by update_artists()
+    title = ax.set_title("", fontsize=9, pad=10)
+    
+    return RainbowArtists(ax, margin_rect, bands, fingerprints, title)
+
+
+def update_artists(rainbow: FingerprintRainbow, artists: RainbowArtists, paper_width: float,
+                   paper_height: float, margin: float, orientation: str = "portrait",
+                   show_radii: bool = False):
+    """
+    Update existing rainbow artists in place to show a rainbow
+    
+    Args:
+        rainbow: Rainbow to draw
+        artists: Artists previously returned by create_artists() or render_rainbow()
+        paper_width: Paper width in inches
+        paper_height: Paper height in inches
+        margin: Margin size in inches
+        orientation: "portrait" or "landscape"
+        show_radii: If True, show radius measurements on the visualization
+    """
+    ax = artists.ax
+    
+    # Swap dimensions if landscape
+    if orientation == "landscape":
+        paper_width, paper_height = paper_height, paper_width
+    
+    # Set up the plot with margins
+    ax.set_xlim(0, paper_width)
+    ax.set_ylim(0, paper_height)
+    
+    # Margin lines
+    artists.margin_rect.set_bounds(margin, margin,
+                                   paper_width - 2*margin,
+                                   paper_height - 2*margin)
+    
+    # Remove radius lines and labels from a previous update
+    for artist in artists.radii:
+        artist.remove()
+    artists.radii.clear()
+    
+    # Center the rainbow on the paper (horizontally) and position from bottom margin
+    center_x = paper_width / 2
+    center_y = margin
+    
+    # Draw each band as a half annulus, the same outline a Wedge would use:
+    # out along the outer arc, back along the inner arc, then close
+    # Band 0 (red) is outermost, band 6 (violet) is innermost
+    outer_radii = rainbow.mid_radii + rainbow.fp_width / 2
+    inner_radii = rainbow.mid_radii - rainbow.fp_width / 2
+    arc = _HALF_ARC.vertices
+    band_vertices = np.concatenate([
+        outer_radii[:, None, None] * arc,
+        inner_radii[:, None, None] * arc[::-1],
+        np.zeros((len(rainbow.COLORS), 1, 2)),
+    ], axis=1) + (center_x, center_y)
+    artists.bands.set_paths([Path(vertices, _BAND_PATH_CODES) for vertices in band_vertices])
+    
+    # Show radii if requested
+    if show_radii:
+        for color, mid_radius in zip(map(tuple, _COLOR_RGBA), rainbow.mid_radii.tolist()):
+            # Draw radius line from center to right edge
+            line_angle = 0  # Horizontal right
+            line_x = center_x + mid_radius * math.cos(line_angle)
+            line_y = center_y + mid_radius * math.sin(line_angle)
+            artists.radii.extend(ax.plot([center_x, line_x], [center_y, line_y],
+                                         color=color, linewidth=1.5, linestyle='-', alpha=0.7))
+            
+            # Add radius label
+            label_x = center_x + (mid_radius * 0.5) * math.cos(line_angle)
+            label_y = center_y + (mid_radius * 0.5) * math.sin(line_angle) + 0.1
+            artists.radii.append(ax.text(label_x, label_y, f'{mid_radius:.2f}"',
+                                         fontsize=8, ha='center', va='bottom',
+                                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                                                   alpha=0.8, edgecolor=color)))
+    
+    # Place fingerprints on every band, tangent to each other
+    offsets, angles = _band_xy(rainbow.mid_radii, np.asarray(rainbow.allocations), center_x, center_y)
+    num_fingerprints = len(offsets)
+    
+    # The major axis (fp_height) should be aligned with the radius
+    # The minor axis (fp_width) should be tangent to the circle (perpendicular to radius)
+    # Angle points from center outward, so major axis should be at that angle
+    # Collection angles are in degrees, measured counter-clockwise from horizontal
+    # widths = major axis (along radius) = fp_height
+    # heights = minor axis (tangent to circle) = fp_width
+    widths = np.full(num_fingerprints, rainbow.fp_height)
+    heights = np.full(num_fingerprints, rainbow.fp_width)
+    if _ELLIPSE_SETTERS:
+        artists.fingerprints.set_offsets(offsets)
+        artists.fingerprints.set_widths(widths)
+        artists.fingerprints.set_heights(heights)
+        artists.fingerprints.set_angles(np.degrees(angles))
+    else:
+        old_fingerprints = artists.fingerprints
+        artists.fingerprints = _fingerprint_collection(ax, widths, heights, np.degrees(angles), offsets)
+        artists.fingerprints.set_animated(old_fingerprints.get_animated())
+        old_fingerprints.remove()
+    
+    # Add title with allocation info
+    allocation_str = " | ".join(f"{c}: {n}" for c, n in zip(_SHORT_COLORS, rainbow.allocations))
+    title_str = f"Fingerprint Rainbow (Band Spacing: {rainbow.band_spacing_percent:.0f}%, Min Inner: {rainbow.min_inner_prints})"
+    if show_radii:
+        title_str += " - Radii Shown"
+    artists.title.set_text(f"{title_str}\n{allocation_str}")
+    
+    # Paper description below the rainbow
+    orientation_label = orientation.capitalize()
+    ax.set_xlabel(f"Paper: {paper_width:.2f}\" × {paper_height:.2f}\" ({orientation_label}) | Margins: {margin:.2f}\"")
@@ -34,20 +34,13 @@ echo ""
 echo "Step 4: Installing Python matplotlib numpy..."
 sudo apt install -y python3-matplotlib python3-numpy
 
-# Make the main script executable
-echo ""
-echo "Step 5: Making fingerprint_rainbow.py executable..."
-chmod +x fingerprint_rainbow.py
-
 echo ""
 echo "=========================================="
 echo "Installation Complete!"
 echo "=========================================="
 echo ""
 echo "To run the application, use:"
-echo "  ./fingerprint_rainbow.py"
-echo "or"
-echo "  python3 fingerprint_rainbow.py"
+echo "  python3 -m fingerprint_rainbow"
 echo ""
 echo "Enjoy creating your fingerprint rainbow!"
 echo ""
@@ -3,8 +3,8 @@
 Test script for Fingerprint Rainbow - demonstrates core functionality
 """
 
-from fingerprint_rainbow import FingerprintRainbow, PAPER_SIZES
-import matplotlib.pyplot as plt
+from fingerprint_rainbow.core import (FingerprintRainbow, STANDARD_PAPER_NAMES, STANDARD_PAPER_WIDTHS,
+                                      STANDARD_PAPER_HEIGHTS, paper_fits)
 
 def test_allocation():
     """Test the fingerprint allocation algorithm"""
@@ -43,6 +43,27 @@ def test_allocation():
     
     print(f"  {'Total':8s}: {total:2d} fingerprints")
 
+def test_min_inner_allocation():
+    """Test that the innermost minimum is met and the total stays at 100"""
+    print("\n" + "=" * 50)
+    print("Testing Minimum Inner Fingerprints")
+    print("=" * 50)
+    
+    # Violet count with no real minimum, from the band capacities alone
+    natural_inner = FingerprintRainbow(0.4, 0.6, 100.0, 1).allocations[6]
+    
+    for min_inner in range(1, 51):
+        allocations = FingerprintRainbow(0.4, 0.6, 100.0, min_inner).allocations
+        assert sum(allocations) == FingerprintRainbow.TOTAL_FINGERPRINTS, (min_inner, allocations)
+        if min_inner > natural_inner:
+            # The minimum applies, so violet gets exactly that many
+            assert allocations[6] == min_inner, (min_inner, allocations)
+    
+    # Outer bands share the rest by the largest remainder method
+    allocations = FingerprintRainbow(0.4, 0.6, 100.0, 30).allocations
+    print(f"\nMin Inner 30: {allocations}")
+    assert allocations == [19, 16, 13, 10, 7, 5, 30]
+
 def test_paper_sizes():
     """Test paper size fitting"""
     print("\n" + "=" * 50)
@@ -60,29 +81,30 @@ def test_paper_sizes():
     print(f"\nRainbow dimensions: {rainbow_width:.2f}\" × {rainbow_height:.2f}\"")
     print(f"Required space with {margin}\" margins: {required_width:.2f}\" × {required_height:.2f}\"")
     
+    papers = list(zip(STANDARD_PAPER_NAMES, STANDARD_PAPER_WIDTHS.tolist(), STANDARD_PAPER_HEIGHTS.tolist()))
+    
     print("\nPaper sizes that fit (Portrait):")
-    for name, paper in PAPER_SIZES.items():
-        if name == "Custom":
-            continue
-        fits = paper.width >= required_width and paper.height >= required_height
+    portrait_fits = paper_fits(required_width, required_height, "portrait")
+    for (name, width, height), fits in zip(papers, portrait_fits.tolist()):
         status = "✓ Fits" if fits else "✗ Too small"
-        print(f"  {name:15s} ({paper.width:5.2f}\" × {paper.height:5.2f}\"): {status}")
+        print(f"  {name:15s} ({width:5.2f}\" × {height:5.2f}\"): {status}")
     
     print("\nPaper sizes that fit (Landscape):")
-    for name, paper in PAPER_SIZES.items():
-        if name == "Custom":
-            continue
-        fits = paper.height >= required_width and paper.width >= required_height
+    landscape_fits = paper_fits(required_width, required_height, "landscape")
+    for (name, width, height), fits in zip(papers, landscape_fits.tolist()):
         status = "✓ Fits" if fits else "✗ Too small"
-        print(f"  {name:15s} ({paper.height:5.2f}\" × {paper.width:5.2f}\"): {status}")
+        print(f"  {name:15s} ({height:5.2f}\" × {width:5.2f}\"): {status}")
 
-def test_visualization():
-    """Create a test visualization"""
+def test_visualization(show=False):
+    """Create a test visualization, optionally displaying it in a window"""
     print("\n" + "=" * 50)
     print("Creating Test Visualization")
     print("=" * 50)
     print("\nGenerating rainbow visualization...")
     
+    # Only this test draws, so the others run without loading pyplot
+    import matplotlib.pyplot as plt
+    
     rainbow = FingerprintRainbow(fingerprint_width=0.4, fingerprint_height=0.6,
                                  band_spacing_percent=100.0, min_inner_prints=5)
     
@@ -92,34 +114,38 @@ def test_visualization():
     # Render on Letter paper with 1.5" margins in portrait
     rainbow.render(ax, paper_width=8.5, paper_height=11, margin=1.5, orientation="portrait")
     
-    # Save to file
+    # Save to file (the figure layout already fits the page, so skip the
+    # extra render pass that bbox_inches='tight' needs to measure it)
     output_file = "test_rainbow.png"
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
+    fig.savefig(output_file, dpi=150)
     print(f"Saved visualization to: {output_file}")
     
     print("\nVisualization complete!")
-    print("(Close the plot window to continue)")
     
-    # Show plot
-    plt.show()
+    if show:
+        print("(Close the plot window to continue)")
+        plt.show()
+    else:
+        plt.close(fig)
 
 if __name__ == "__main__":
     print("\nFingerprint Rainbow - Test Suite\n")
     
     test_allocation()
+    test_min_inner_allocation()
     test_paper_sizes()
     
     # Ask if user wants to see visualization
     try:
         response = input("\nWould you like to see a test visualization? (y/n): ")
         if response.lower() in ['y', 'yes']:
-            test_visualization()
+            test_visualization(show=True)
         else:
             print("\nSkipping visualization. Run the full GUI with:")
-            print("  python3 fingerprint_rainbow.py")
+            print("  python3 -m fingerprint_rainbow")
     except (EOFError, KeyboardInterrupt):
         print("\n\nTest complete. Run the full GUI with:")
-        print("  python3 fingerprint_rainbow.py")
+        print("  python3 -m fingerprint_rainbow")
     
     print("\n" + "=" * 50)
     print("All tests complete!")